@@ -2,13 +2,10 @@
 
 import sys
 import pathlib
-import os
 
 import click
 from click.exceptions import ClickException
 
-from .model import import_3dm
-
 
 @click.group()
 def main():
@@ -39,16 +36,17 @@ def translate_recipe(rhino_file, name, folder, config):
     Args:
         rhino-file: Path to the rhino file.
     """
+    # imported here so that --help does not load honeybee, rhino3dm and pydantic
+    from .model import import_3dm
+
     folder = pathlib.Path(folder)
     folder.mkdir(exist_ok=True)
-    model = import_3dm(rhino_file, config_path=config)
-    model.to_hbjson(name=name, folder=folder)
-    hbjson_file = os.path.join(folder, name + '.hbjson')
 
     try:
-        output_file = hbjson_file
+        model = import_3dm(rhino_file, config_path=config)
+        hbjson_file = model.to_hbjson(name=name, folder=folder)
     except Exception as e:
         raise ClickException(f'HBJSON generation failed:\n{e}')
     else:
-        print(f'Success: {output_file}', file=sys.stderr)
+        print(f'Success: {hbjson_file}', file=sys.stderr)
         return sys.exit(0)
@@ -90,15 +90,14 @@ class Config(BaseModel):
 
     @validator('sources')
     def check_sources(cls, v):
-        sources = v
-        if sources:
-            sources = list(v.keys())
-            if len(sources) > 1:
+        if v:
+            if len(v) > 1:
                 raise ValueError('sources can only have one key.')
 
-            if sources[0] != 'radiance_material':
+            key = next(iter(v))
+            if key != 'radiance_material':
                 raise ValueError(
-                        f'invalid sources key: {sources[0]}.'
+                        f'invalid sources key: {key}.'
                         'key must be radiance_material.'
                 )
         return v
@@ -106,38 +105,30 @@ class Config(BaseModel):
     @validator('layers')
     def check_rad(cls, v, values):
         config_layers = v
-        sources = values['sources']
+        # sources is missing from values if it failed its own validation
+        sources = values.get('sources')
 
-        radiance_material_request = False
-        for layer in config_layers:
-            if config_layers[layer].radiance_material:
-                radiance_material_request = True
-                break
+        rad_mat = {layer.radiance_material for layer in config_layers.values()
+                   if layer.radiance_material}
 
-        if radiance_material_request:
+        if rad_mat:
             if sources:
-                os.path.isfile(sources['radiance_material'])
-                try:
-                    modifiers_dict = mat_to_dict(sources['radiance_material'])
-                except ImportError:
-                    mat_path = sources['radiance_material']
+                mat_path = sources['radiance_material']
+                if not os.path.isfile(mat_path):
                     raise ValueError(
-                        f'The path {mat_path} is not a valid path.' 
+                        f'The path {mat_path} is not a valid path.'
                         ' Please try using double backslashes in the  file path.'
                         )
-                else:
-                    rad_mat = [config_layers[layer].radiance_material for layer
-                        in config_layers if config_layers[layer].radiance_material]
-
-                    rad_mat_check = [True for mat in rad_mat if mat in modifiers_dict]
-                    if len(rad_mat) != rad_mat_check.count(True):
-                        raise ValueError(
-                            'Please make sure all the radiance materials used in'
-                            ' the config file are also found in the radiance material'
-                            ' file and names of radiance materials in the config file'
-                            ' match the radiance identifiers in the radiance material'
-                            ' file.'
-                        )
+
+                modifiers_dict = mat_to_dict(mat_path)
+                if rad_mat - modifiers_dict.keys():
+                    raise ValueError(
+                        'Please make sure all the radiance materials used in'
+                        ' the config file are also found in the radiance material'
+                        ' file and names of radiance materials in the config file'
+                        ' match the radiance identifiers in the radiance material'
+                        ' file.'
+                    )
             else:
                 raise ValueError(
                     '"radiance_material" as a key and a valid path to to the radiance'
@@ -155,7 +146,7 @@ class Config(BaseModel):
         Returns:
             Boolean value of True if no error is raised.
         """
-        rhino_layers = [layer.Name for layer in file_3dm.Layers]
+        rhino_layers = {layer.Name for layer in file_3dm.Layers}
 
         layer_check = [layer for layer in self.layers if layer not in rhino_layers]
         if layer_check:
@@ -185,8 +176,8 @@ def check_config(file_3dm, config_path):
             'Not a valid json file.'
             )
     else:
-        # Parse config.json using config schema
-        config_obj = Config.parse_file(config_path)
+        # Validate the already loaded dictionary using config schema
+        config_obj = Config.parse_obj(config)
         if config_obj.check_layers(file_3dm):
             return config_obj.dict(exclude_none=True)
 
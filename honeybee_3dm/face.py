@@ -9,17 +9,22 @@ from honeybee.typing import clean_and_id_string, clean_string
 from .togeometry import to_face3d
 from .layer import objects_on_layer, objects_on_parent_child
 from .grid import import_grids
-from .helper import grid_controls, face3d_to_hb_face_with_face_type, face3d_to_hb_object
-from .helper import face3d_to_hb_face_with_rad, child_layer_control
+from .helper import grid_controls, child_layer_control
+from .helper import _face3d_to_hb_face_with_face_type, _face3d_to_hb_object
+from .helper import _face3d_to_hb_face_with_rad
 
 
 tolerance_warning = 'Could not create a face for object of ID {} Please reduce the unit' \
 ' tolerance value in rhino, save the file and try again. You might need to repeat' \
 ' this more than once if the face is too small for the unit tolerance selected.'
 
+zero_area_warning = '{} face(s) with zero area were created from object with id: {}.' \
+' These faces are avoided.'
+
 
 def import_objects_with_config(
-        rhino3dm_file, layer, tolerance, *, config=None, modifiers_dict=None):
+        rhino3dm_file, layer, tolerance, *, config=None, modifiers_dict=None,
+        layer_objects=None):
     """Import Rhino planar geometry as Honeybee faces.
 
     This function looks up a rhino3dm file, converts the objects
@@ -34,6 +39,8 @@ def import_objects_with_config(
         config: A dictionary of config settings. Defaults to None
         modifiers_dict: A dictionary with radiance identifier to modifier structure.
             Defaults to None.
+        layer_objects: An optional dictionary of objects grouped by layer index from
+            objects_by_layer_index. Defaults to None.
 
     Returns:
         A tuple of following lists;
@@ -49,24 +56,48 @@ def import_objects_with_config(
     """
     # Placeholders
     hb_faces, hb_shades, hb_apertures, hb_doors, hb_grids = ([], [], [], [], [])
+    layer_name = layer.Name
+    layer_grid_controls = grid_controls(config, layer_name)
 
     # If Grids are requested for a layer
-    if grid_controls(config, layer.Name):
+    if layer_grid_controls:
 
         hb_grids = import_grids(
             rhino3dm_file, layer, tolerance,
-            grid_controls=grid_controls(config, layer.Name),
-            child_layer=child_layer_control(config, layer.Name))
+            grid_controls=layer_grid_controls,
+            child_layer=child_layer_control(config, layer_name),
+            layer_objects=layer_objects)
 
     # If Grids are not requested for a layer
     else:
+        # Resolve once for the layer which Honeybee objects are created from its faces
+        layer_config = config['layers'][layer_name]
+        # If face_type settting is employed
+        if 'honeybee_face_type' in layer_config:
+            to_hb_face = _face3d_to_hb_face_with_face_type
+        # If only radiance material settting is employed
+        elif 'honeybee_face_object' not in layer_config and \
+                'radiance_material' in layer_config:
+            to_hb_face = _face3d_to_hb_face_with_rad
+        else:
+            to_hb_face = None
+        # If face_object settting is employed
+        to_hb_object = not to_hb_face and 'honeybee_face_object' in layer_config
+
+        # Bound methods for the face loop
+        add_face = hb_faces.append
+        add_apertures, add_doors, add_shades = \
+            hb_apertures.extend, hb_doors.extend, hb_shades.extend
+
         # If child layers needs to be included
-        if child_layer_control(config, layer.Name):
-            objects = objects_on_parent_child(rhino3dm_file, layer.Name)
+        if child_layer_control(config, layer_name):
+            objects = objects_on_parent_child(
+                rhino3dm_file, layer_name, layer_objects=layer_objects)
 
         # If child layers do not need to be included
         else:
-            objects = objects_on_layer(rhino3dm_file, layer)
+            objects = objects_on_layer(
+                rhino3dm_file, layer, layer_objects=layer_objects)
 
         for obj in objects:
             try:
@@ -81,40 +112,37 @@ def import_objects_with_config(
                 warnings.warn(tolerance_warning.format(obj.Attributes.Id))
                 continue
             
+            # All the faces from an object share its name so it is only cleaned once
             name = obj.Attributes.Name
+            clean_name = clean_string(name) if name else None
+            # Zero area faces are reported once per object after the face loop
+            zero_area_faces = 0
 
             for face_obj in lb_faces:
 
                 if face_obj.area == 0:
-                    warnings.warn(
-                        'A face with zero area was created from object with id:'
-                        f' {obj.Attributes.Id}. This face is avoided.'
-                    )
+                    zero_area_faces += 1
                     continue
 
-                # If face_type settting is employed
-                if 'honeybee_face_type' in config['layers'][layer.Name]:
-                    hb_faces.append(face3d_to_hb_face_with_face_type(config, face_obj,
-                                    name, layer.Name))
-                
-                # If only radiance material settting is employed
-                elif 'honeybee_face_type' not in config['layers'][layer.Name] and\
-                    'honeybee_face_object' not in config['layers'][layer.Name] and\
-                        'radiance_material' in config['layers'][layer.Name]:
-                    hb_faces.append(face3d_to_hb_face_with_rad(config, face_obj, name,
-                                    layer.Name))
-                
-                # If face_object settting is employed
-                elif 'honeybee_face_object' in config['layers'][layer.Name]:
-                    hb_objects = face3d_to_hb_object(config, face_obj, name, layer.Name)
-                    hb_apertures.extend(hb_objects[0])
-                    hb_doors.extend(hb_objects[1])
-                    hb_shades.extend(hb_objects[2])
+                if to_hb_face:
+                    add_face(to_hb_face(
+                        config, face_obj, clean_name, layer_name, modifiers_dict))
+
+                elif to_hb_object:
+                    apertures, doors, shades = _face3d_to_hb_object(
+                        config, face_obj, clean_name, layer_name, modifiers_dict)
+                    add_apertures(apertures)
+                    add_doors(doors)
+                    add_shades(shades)
+
+            if zero_area_faces:
+                warnings.warn(
+                    zero_area_warning.format(zero_area_faces, obj.Attributes.Id))
 
     return hb_faces, hb_shades, hb_apertures, hb_doors, hb_grids
 
 
-def import_objects(file_3dm, layer, tolerance):
+def import_objects(file_3dm, layer, tolerance, *, layer_objects=None):
     """Get default Honeybee Faces for a Rhino3dm layer.
 
     Args:
@@ -122,12 +150,15 @@ def import_objects(file_3dm, layer, tolerance):
         layer: A Rhino3dm layer object.
         tolerance: A number for model tolerance. By default the tolerance is set to
             the ModelAbsoluteTolerance value in input 3DM file.
+        layer_objects: An optional dictionary of objects grouped by layer index from
+            objects_by_layer_index. Defaults to None.
 
     Returns:
         A list of Honeybee Face objects.
     """
     hb_faces = []
-    objects = objects_on_layer(file_3dm, layer=layer)
+    add_face = hb_faces.append
+    objects = objects_on_layer(file_3dm, layer=layer, layer_objects=layer_objects)
     
     for obj in objects:
         try:
@@ -142,19 +173,23 @@ def import_objects(file_3dm, layer, tolerance):
             warnings.warn(tolerance_warning.format(obj.Attributes.Id))
             continue
 
+        # All the faces from an object share its name so it is only cleaned once
         name = obj.Attributes.Name
+        clean_name = clean_string(name) if name else None
+        # Zero area faces are reported once per object after the face loop
+        zero_area_faces = 0
         for face_obj in lb_faces:
             if face_obj.area == 0:
-                warnings.warn(
-                    'A face with zero area was created from object with id:'
-                    f' {obj.Attributes.Id}. This face is avoided.'
-                )
+                zero_area_faces += 1
                 continue
-            obj_name = name or clean_and_id_string(layer.Name)
-            args = [clean_string(obj_name), face_obj]
+            obj_name = clean_name or clean_and_id_string(layer.Name)
+            args = [obj_name, face_obj]
             hb_face = Face(*args)
             hb_face.display_name = args[0]
-            hb_faces.append(hb_face)
+            add_face(hb_face)
+
+        if zero_area_faces:
+            warnings.warn(zero_area_warning.format(zero_area_faces, obj.Attributes.Id))
 
     return hb_faces
     
\ No newline at end of file
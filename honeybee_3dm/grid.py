@@ -11,7 +11,8 @@ from .layer import objects_on_layer, objects_on_parent_child
 
 
 def import_grids(
-    rhino3dm_file, layer, tolerance, *, grid_controls=None, child_layer=False):
+        rhino3dm_file, layer, tolerance, *, grid_controls=None, child_layer=False,
+        layer_objects=None):
     """Creates Honeybee grids from a rhino3dm file.
 
     This function assumes all the grid objects are under a layer named ``grid``.
@@ -25,35 +26,38 @@ def import_grids(
             for grid-size-x, grid-size-y, and grid-offset respectively.
         child_layer: A bool. True will generate grids from the objects on the child layer
             of a layer in addition to the objects on the parent layer. Defaults to False.
-        
+        layer_objects: An optional dictionary of objects grouped by layer index from
+            objects_by_layer_index. Defaults to None.
+
     Returns:
         A list of Honeybee grids.
     """
     hb_grids = []
-    # if objects on child layers are not requested
-    if not child_layer:
-        grid_objs = objects_on_layer(rhino3dm_file, layer)
-    
     # if objects on child layers are requested
     if child_layer:
-        grid_objs = objects_on_parent_child(rhino3dm_file, layer.Name)
-    
+        grid_objs = objects_on_parent_child(
+            rhino3dm_file, layer.Name, layer_objects=layer_objects)
+
+    # if objects on child layers are not requested
+    else:
+        grid_objs = objects_on_layer(
+            rhino3dm_file, layer, layer_objects=layer_objects)
+
     # Set default grid settings if not provided
     if not grid_controls:
         grid_controls = (1.0, 1.0, 0.0)
 
     for obj in grid_objs:
         geo = obj.Geometry
-        
+        name = obj.Attributes.Name
+        obj_name = clean_string(name) if name else clean_and_id_string('Grid')
+
         # If it's a Mesh use it to create grids
         # This is done so that if a user has created mesh with certain density
         # the same can be used to create grids
         if isinstance(geo, rhino3dm.Mesh):
             mesh3d = mesh_to_mesh3d(geo)
-            name = obj.Attributes.Name
-            obj_name = name or clean_and_id_string('Grid')
-            args = [clean_string(obj_name), mesh3d]
-            hb_grids.append(SensorGrid.from_mesh3d(*args))
+            hb_grids.append(SensorGrid.from_mesh3d(obj_name, mesh3d))
 
         else:
             try:
@@ -65,11 +69,7 @@ def import_grids(
                 ' object is not supported for grids. You should try again with a'
                 ' smaller grid size in the config file.'
             )
-            name = obj.Attributes.Name
-            obj_name = name or clean_and_id_string('Grid')
-            args = [
-                clean_string(obj_name), faces, grid_controls[0], grid_controls[0],
-                grid_controls[1]]
-            hb_grids.append(SensorGrid.from_face3d(*args))
+            hb_grids.append(SensorGrid.from_face3d(
+                obj_name, faces, grid_controls[0], grid_controls[0], grid_controls[1]))
 
     return hb_grids
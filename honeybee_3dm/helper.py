@@ -10,6 +10,26 @@ from honeybee.facetype import face_types
 from honeybee.typing import clean_and_id_string, clean_string
 
 
+# Rhino unit systems that are supported by Honeybee
+_UNITS = ['Meters', 'Millimeters', 'Feet', 'Inches', 'Centimeters']
+
+# Honeybee face types for the honeybee_face_type values in the config
+_FACE_TYPES = {
+    'roof': face_types.roof_ceiling,
+    'wall': face_types.wall,
+    'floor': face_types.floor,
+    'airwall': face_types.air_boundary
+}
+
+# Honeybee object class and its index in the output of face3d_to_hb_object for the
+# honeybee_face_object values in the config
+_FACE_OBJECTS = {
+    'aperture': (Aperture, 0),
+    'door': (Door, 1),
+    'shade': (Shade, 2)
+}
+
+
 def get_unit_system(file_3dm):
     """Get units from a 3dm file object.
 
@@ -19,8 +39,6 @@ def get_unit_system(file_3dm):
     Returns:
         Rhino3dm file unit as a string.
     """
-    UNITS = ['Meters', 'Millimeters', 'Feet', 'Inches', 'Centimeters']
-
     try:
         file_unit = file_3dm.Settings.ModelUnitSystem
     except AttributeError:
@@ -28,9 +46,9 @@ def get_unit_system(file_3dm):
 
     unit = str(file_unit).split('.')[-1]
 
-    if unit not in UNITS:
+    if unit not in _UNITS:
         raise ValueError(
-            f'{unit} is not currently supported. Supported units are {UNITS}.'
+            f'{unit} is not currently supported. Supported units are {_UNITS}.'
         )
 
     return unit
@@ -46,12 +64,7 @@ def child_layer_control(config, layer_name):
     Returns:
         A bool.
     """
-
-    if 'include_child_layers' in config['layers'][layer_name] and \
-            config['layers'][layer_name]['include_child_layers']:
-        return True
-    else:
-        return False
+    return bool(config['layers'][layer_name].get('include_child_layers'))
 
 
 def grid_controls(config, layer_name):
@@ -68,10 +81,10 @@ def grid_controls(config, layer_name):
         
         if valid grid settings are found in the config file or None
     """
+    layer_config = config['layers'][layer_name]
 
-    if 'grid_settings' in config['layers'][layer_name] and \
-            config['layers'][layer_name]['exclude_from_rad']:
-        grid_controls = config['layers'][layer_name]['grid_settings']
+    if 'grid_settings' in layer_config and layer_config['exclude_from_rad']:
+        grid_controls = layer_config['grid_settings']
         return grid_controls['grid_size'], grid_controls['grid_offset']
 
 
@@ -91,16 +104,73 @@ def check_parent_in_config(file_3dm, config, layer_name, parent_layer_name):
     Returns:
         A bool.
     """
+    parent_config = config['layers'].get(parent_layer_name)
+    return bool(parent_config and parent_config.get('include_child_layers'))
+
+
+def _face3d_to_hb(
+        hb_class, config, face_obj, name, layer_name, modifiers_dict, *args):
+    """Create a Honeybee object and assign the radiance modifier of its layer.
+
+    Args:
+        hb_class: A Honeybee class such as Face, Aperture, Door, or Shade.
+        config: A dictionary of the config settings.
+        face_obj: A Ladybug Face3d object.
+        name: A text string of the cleaned name of the rhino object or None to
+            create an identifier from the layer name.
+        layer_name: A text string of the rhino layer name.
+        modifiers_dict: A dictionary with radiance identifier to modifier structure
+            or None to read the modifiers from the radiance material file.
+        args: Additional arguments for the Honeybee class such as the face type.
+
+    Returns:
+        A Honeybee object.
+    """
+    obj_name = name or clean_and_id_string(layer_name)
+    hb_obj = hb_class(obj_name, face_obj, *args)
+    hb_obj.display_name = obj_name
+
+    radiance_material = config['layers'][layer_name].get('radiance_material')
+    if radiance_material is not None:
+        if modifiers_dict is None:
+            modifiers_dict = mat_to_dict(config['sources']['radiance_material'])
+        hb_obj.properties.radiance.modifier = modifiers_dict[radiance_material]
+
+    return hb_obj
 
-    if parent_layer_name in config['layers'] and\
-            'include_child_layers' in config['layers'][parent_layer_name] and\
-            config['layers'][parent_layer_name]['include_child_layers']:
-        return True
-    else:
-        return False
 
+def _clean_name(name):
+    """Get a cleaned name of a rhino object or None if the object has no name."""
+    return clean_string(name) if name else None
 
-def face3d_to_hb_face_with_face_type(config, face_obj, name, layer_name):
+
+def _face3d_to_hb_face_with_face_type(
+        config, face_obj, clean_name, layer_name, modifiers_dict):
+    """face3d_to_hb_face_with_face_type for an already cleaned object name."""
+    face_type = _FACE_TYPES[config['layers'][layer_name]['honeybee_face_type']]
+    return _face3d_to_hb(
+        Face, config, face_obj, clean_name, layer_name, modifiers_dict, face_type)
+
+
+def _face3d_to_hb_face_with_rad(
+        config, face_obj, clean_name, layer_name, modifiers_dict):
+    """face3d_to_hb_face_with_rad for an already cleaned object name."""
+    return _face3d_to_hb(
+        Face, config, face_obj, clean_name, layer_name, modifiers_dict)
+
+
+def _face3d_to_hb_object(config, face_obj, clean_name, layer_name, modifiers_dict):
+    """face3d_to_hb_object for an already cleaned object name."""
+    hb_objects = ([], [], [])
+    hb_class, index = _FACE_OBJECTS[config['layers'][layer_name]['honeybee_face_object']]
+    hb_objects[index].append(_face3d_to_hb(
+        hb_class, config, face_obj, clean_name, layer_name, modifiers_dict))
+
+    return hb_objects
+
+
+def face3d_to_hb_face_with_face_type(
+        config, face_obj, name, layer_name, *, modifiers_dict=None):
     """Create a Honeybee Face object with a specific face_type.
 
     This function returns a Honeybee Face object with a specific face_type requested
@@ -112,40 +182,19 @@ def face3d_to_hb_face_with_face_type(config, face_obj, name, layer_name):
         face_obj: A Ladybug Face3d object.
         name: A text string of the name of the rhino object.
         layer_name: A text string of the rhino layer name.
+        modifiers_dict: A dictionary with radiance identifier to modifier structure.
+            Defaults to None which will read the modifiers from the radiance
+            material file in the config.
 
     Returns:
         A Honeybee Face object.
     """
-    
-    obj_name = name or clean_and_id_string(layer_name)
-    args = [clean_string(obj_name), face_obj]
-    
-    if config['layers'][layer_name]['honeybee_face_type'] == 'roof':
-        face_type = face_types.roof_ceiling
-    
-    elif config['layers'][layer_name]['honeybee_face_type'] == 'wall':
-        face_type = face_types.wall
-    
-    elif config['layers'][layer_name]['honeybee_face_type'] == 'floor':
-        face_type = face_types.floor
-    
-    elif config['layers'][layer_name]['honeybee_face_type'] == 'airwall':
-        face_type = face_types.air_boundary
-    
-    args.append(face_type)
-    hb_face = Face(*args)
-    hb_face.display_name = args[0]
-    
-    if 'radiance_material' in config['layers'][layer_name]:
-        radiance_modifiers = mat_to_dict(config['sources']['radiance_material'])
-        hb_face.properties.radiance.modifier = radiance_modifiers[config
-            ['layers'][layer_name]['radiance_material']]
-        return hb_face
-    else:
-        return hb_face
-
-
-def face3d_to_hb_face_with_rad(config, face_obj, name, layer_name):
+    return _face3d_to_hb_face_with_face_type(
+        config, face_obj, _clean_name(name), layer_name, modifiers_dict)
+
+
+def face3d_to_hb_face_with_rad(
+        config, face_obj, name, layer_name, *, modifiers_dict=None):
     """Create a Honeybee Face object with a radiance material assigned to it.
 
     Args:
@@ -153,26 +202,19 @@ def face3d_to_hb_face_with_rad(config, face_obj, name, layer_name):
         face_obj: A Ladybug Face3d object.
         name: A text string of the name of the rhino object.
         layer_name: A text string of the rhino layer name.
+        modifiers_dict: A dictionary with radiance identifier to modifier structure.
+            Defaults to None which will read the modifiers from the radiance
+            material file in the config.
 
     Returns:
         A Honeybee Face object.
     """
-    
-    obj_name = name or clean_and_id_string(layer_name)
-    args = [clean_string(obj_name), face_obj]
-    hb_face = Face(*args)
-    hb_face.display_name = args[0]
-    
-    if 'radiance_material' in config['layers'][layer_name]:
-        radiance_modifiers = mat_to_dict(config['sources']['radiance_material'])
-        hb_face.properties.radiance.modifier = radiance_modifiers[config
-            ['layers'][layer_name]['radiance_material']]
-        return hb_face
-    else:
-        return hb_face
-
-
-def face3d_to_hb_object(config, face_obj, name, layer_name):
+    return _face3d_to_hb_face_with_rad(
+        config, face_obj, _clean_name(name), layer_name, modifiers_dict)
+
+
+def face3d_to_hb_object(
+        config, face_obj, name, layer_name, *, modifiers_dict=None):
     """Create Honeybee Aperture, Shade, and Door objects.
 
     Args:
@@ -180,44 +222,18 @@ def face3d_to_hb_object(config, face_obj, name, layer_name):
         face_obj: A Ladybug Face3d object.
         name: A text string of the name of the rhino object.
         layer_name: A text string of the rhino layer name.
+        modifiers_dict: A dictionary with radiance identifier to modifier structure.
+            Defaults to None which will read the modifiers from the radiance
+            material file in the config.
 
     Returns:
         A tuple of lists;
 
         -   Honeybee Aperture objects,
-        -   Honeybee Shade objects,
-        -   Honeybee Door objects.
+        -   Honeybee Door objects,
+        -   Honeybee Shade objects.
 
         List will be empty if no objects are found for that Honeybee object.
     """
-
-    hb_apertures, hb_doors, hb_shades = ([], [], [])
-
-    obj_name = name or clean_and_id_string(layer_name)
-    args = [clean_string(obj_name), face_obj]
-
-    def hb_object(config, layer_name, hb_obj):
-        if 'radiance_material' in config['layers'][layer_name]:
-            radiance_modifiers = mat_to_dict(config['sources']['radiance_material'])
-            hb_obj.properties.radiance.modifier = radiance_modifiers[config[
-                'layers'][layer_name]['radiance_material']]
-            return hb_obj
-        else:
-            return hb_obj
-
-    if config['layers'][layer_name]['honeybee_face_object'] == 'aperture':
-        hb_aperture = Aperture(*args)
-        hb_aperture.display_name = args[0]
-        hb_apertures.append(hb_object(config, layer_name, hb_aperture))
-
-    elif config['layers'][layer_name]['honeybee_face_object'] == 'door':
-        hb_door = Door(*args)
-        hb_door.display_name = args[0]
-        hb_doors.append(hb_object(config, layer_name, hb_door))
-
-    elif config['layers'][layer_name]['honeybee_face_object'] == 'shade':
-        hb_shade = Shade(*args)
-        hb_shade.display_name = args[0]
-        hb_shades.append(hb_object(config, layer_name, hb_shade))
-
-    return hb_apertures, hb_doors, hb_shades
+    return _face3d_to_hb_object(
+        config, face_obj, _clean_name(name), layer_name, modifiers_dict)
@@ -1,5 +1,7 @@
 """Functions to work with layers in a rhino file."""
 
+from operator import itemgetter
+
 
 def child_parent_dict(file_3dm):
     """Get a dictionary with child layer name and parent layer name structure.
@@ -19,6 +21,32 @@ def child_parent_dict(file_3dm):
     return child_parent_dict
 
 
+def _layer_paths(file_3dm):
+    """Get a list of layers with the names on their full paths.
+
+    Args:
+        file_3dm: A rhino3dm file object
+
+    Returns:
+        A list of (layer, list of parent and child layer names) tuples.
+    """
+    return [(layer, layer.FullPath.split('::')) for layer in file_3dm.Layers]
+
+
+def _parent_child_names(layer_paths, layer_name):
+    """Get a set of parent and child layer names for a layer.
+
+    Args:
+        layer_paths: A list of layers with their full paths from _layer_paths.
+        layer_name: Text string of a layer name.
+
+    Returns:
+        A set of parent and child layer names.
+    """
+    return {name for _, parent_children in layer_paths
+            if layer_name in parent_children for name in parent_children}
+
+
 def parent_child_layers(file_3dm, layer_name):
     """Get a list of parent and child layers for a layer.
 
@@ -29,63 +57,99 @@ def parent_child_layers(file_3dm, layer_name):
     Returns:
         A list of parent and child layer names.
     """
-    layer_names = []
-    for layer in file_3dm.Layers:
-        parent_children = layer.FullPath.split('::')
-        if layer_name in parent_children:
-            layer_names += parent_children
+    return list(_parent_child_names(_layer_paths(file_3dm), layer_name))
+
+
+def objects_by_layer_index(file_3dm):
+    """Get a dictionary of the visible objects in a rhino file grouped by layer index.
+
+    This function scans the objects in the rhino file only once. The output can be
+    passed to the other functions in this module to avoid scanning all the objects
+    in the rhino file for every layer.
+
+    Args:
+        file_3dm: Input Rhino 3DM object.
+
+    Returns:
+        A dictionary with layer index to list of (position, Rhino3dm object) tuples
+        structure. The position is the index of the object in the rhino file.
+    """
+    layer_objects = {}
+    for position, obj in enumerate(file_3dm.Objects):
+        attributes = obj.Attributes
+        if attributes.Visible:
+            layer_objects.setdefault(attributes.LayerIndex, []).append((position, obj))
 
-    return list(set(layer_names))
+    return layer_objects
 
 
-def filter_objects_by_layer_index(file_3dm, layer_index):
+def filter_objects_by_layer_index(file_3dm, layer_index, *, layer_objects=None):
     """Get all the objects in a layer based on layer index.
 
     Args:
         file_3dm: Input Rhino 3DM object.
         layer_index: A list of indexes for Rhino layers
+        layer_objects: An optional dictionary of objects grouped by layer index from
+            objects_by_layer_index. Defaults to None which will scan all the objects
+            in the rhino file.
 
     Returns:
         A list of Rhino3dm objects.
     """
+    if layer_objects is not None:
+        # Put the objects from all the layers back in the order of the rhino file
+        indexed_objects = sorted(
+            (item for index in set(layer_index)
+             for item in layer_objects.get(index, [])),
+            key=itemgetter(0))
+        return [obj for _, obj in indexed_objects]
 
-    return [obj for obj in file_3dm.Objects for index in layer_index
-            if obj.Attributes.LayerIndex == index and obj.Attributes.Visible]
+    layer_index = set(layer_index)
+    return [obj for obj in file_3dm.Objects
+            if obj.Attributes.LayerIndex in layer_index and obj.Attributes.Visible]
 
 
-def objects_on_parent_child(file_3dm, layer_name):
+def objects_on_parent_child(file_3dm, layer_name, *, layer_objects=None):
     """Get all the objects on a layer and its child-layers.
 
     Args:
         file_3dm: Input Rhino3DM object.
         layer_name: Rhino layer name.
+        layer_objects: An optional dictionary of objects grouped by layer index from
+            objects_by_layer_index. Defaults to None.
 
     Returns:
         A list of Rhino3dm objects on the layer and its child layers.
     """
-    # Get a list of parent and child layers for the layer_name
-    parent_child = parent_child_layers(file_3dm, layer_name)
+    # Read the layer table once for both the parent and child layer names of the
+    # layer_name and the indexes of those layers
+    layer_paths = _layer_paths(file_3dm)
+    parent_child = _parent_child_names(layer_paths, layer_name)
 
     layer_index = [
-        layer.Index for layer in file_3dm.Layers if layer.Name in parent_child]
+        layer.Index for layer, _ in layer_paths if layer.Name in parent_child]
     if not layer_index:
         raise ValueError(f'Find no layer named "{layer_name}"')
 
-    return filter_objects_by_layer_index(file_3dm, layer_index)
+    return filter_objects_by_layer_index(
+        file_3dm, layer_index, layer_objects=layer_objects)
 
 
-def objects_on_layer(file_3dm, layer):
+def objects_on_layer(file_3dm, layer, *, layer_objects=None):
     """Get a list of objects on a layer.
 
     Args:
         file_3dm: Input Rhino3DM object.
         layer: A Rhino3dm layer object.
+        layer_objects: An optional dictionary of objects grouped by layer index from
+            objects_by_layer_index. Defaults to None.
 
     Returns:
         A list of Rhino3dm objects on a layer.
     """
     layer_index = [layer.Index]
-    return filter_objects_by_layer_index(file_3dm, layer_index)
+    return filter_objects_by_layer_index(
+        file_3dm, layer_index, layer_objects=layer_objects)
 
 
 def visible_layers(file_3dm):
@@ -106,13 +170,9 @@ def visible_layers(file_3dm):
 
     for layer in file_3dm.Layers:
         layer_parent = layer.FullPath.split('::')
-        visibility_check = [
-            False if not layer_name_to_layer[layer_name].Visible
-            else True for layer_name in layer_parent]
-        if visibility_check.count(False) == 0:
+        if all(layer_name_to_layer[layer_name].Visible
+               for layer_name in layer_parent):
             visible_layers.append(layer)
-        else:
-            pass
     
     return visible_layers
     
\ No newline at end of file
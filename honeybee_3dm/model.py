@@ -6,8 +6,9 @@ from honeybee.model import Model
 
 from .face import import_objects, import_objects_with_config
 from .helper import get_unit_system, check_parent_in_config
-from .layer import child_parent_dict, visible_layers
+from .layer import child_parent_dict, visible_layers, objects_by_layer_index
 from .config import check_config
+from .material import mat_to_dict
 
 
 def import_3dm(path, name=None, *, config_path=None):
@@ -48,65 +49,83 @@ def import_3dm(path, name=None, *, config_path=None):
         # Validate the config file and get it as a directory
 
         config = check_config(rhino3dm_file, config_path)
+
+        # Read the radiance modifiers once if any layer requests them
+        if any('radiance_material' in layer_config
+                for layer_config in config['layers'].values()):
+            modifiers_dict = mat_to_dict(config['sources']['radiance_material'])
+        else:
+            modifiers_dict = None
     else:
         config = None
 
     # Extracting unit parameters from rhino
-    model_tolerance = rhino3dm_file.Settings.ModelAbsoluteTolerance
-    model_angle_tolerance = rhino3dm_file.Settings.ModelAngleToleranceDegrees
+    settings = rhino3dm_file.Settings
+    model_tolerance = settings.ModelAbsoluteTolerance
+    model_angle_tolerance = settings.ModelAngleToleranceDegrees
     model_unit = get_unit_system(rhino3dm_file)
 
     # Place holders
-    hb_rooms, hb_faces, hb_shades, hb_apertures, hb_doors, hb_grids = tuple(
-            [[] for _ in range(6)])
+    hb_rooms, hb_faces, hb_shades, hb_apertures, hb_doors, hb_grids = \
+        [], [], [], [], [], []
+
+    # A dictionary with layer index : visible objects structure
+    layer_objects = objects_by_layer_index(rhino3dm_file)
 
     # A dictionary with child layer : parent layer structure
     child_to_parent = child_parent_dict(rhino3dm_file)
 
     # Get all the visible layers from rhino
-    if visible_layers(rhino3dm_file):
-        rhino_visible_layers = visible_layers(rhino3dm_file)
-        rhino_visible_layer_names = [layer.Name for layer in rhino_visible_layers]
-    else:
+    rhino_visible_layers = visible_layers(rhino3dm_file)
+    if not rhino_visible_layers:
         raise ValueError(
             'Please turn on the layers in rhino you wish to import objects from.'
         )
+    rhino_visible_layer_names = {layer.Name for layer in rhino_visible_layers}
 
     # If config is provided
     if config:
         
+        config_layers = config['layers']
         for layer in rhino3dm_file.Layers:
-
-            # If the layer is not in config and not "on" in rhino, ignore
-            if layer.Name not in config['layers'] and \
-                layer.Name not in rhino_visible_layer_names:
-                continue
+            layer_name = layer.Name
 
             # Import objects from each layer in the config file
-            elif layer.Name in config['layers']:
+            if layer_name in config_layers:
                 hb_objs = import_objects_with_config(
-                    rhino3dm_file, layer, model_tolerance, config=config)
+                    rhino3dm_file, layer, model_tolerance, config=config,
+                    modifiers_dict=modifiers_dict, layer_objects=layer_objects)
                 hb_faces.extend(hb_objs[0])
                 hb_shades.extend(hb_objs[1])
                 hb_apertures.extend(hb_objs[2])
                 hb_doors.extend(hb_objs[3])
                 hb_grids.extend(hb_objs[4])
 
+            # If the layer is not in config and not "on" in rhino, ignore
+            elif layer_name not in rhino_visible_layer_names:
+                continue
+
+            # If the layer is not in config and has no objects, ignore
+            elif layer.Index not in layer_objects:
+                continue
+
             # skip child layers that might already have been imported
             elif check_parent_in_config(rhino3dm_file, config,
-                layer.Name, child_to_parent[layer.Name]):
+                layer_name, child_to_parent[layer_name]):
                 continue
 
             # Import objects from each layer not in the config file
-            elif layer.Name in rhino_visible_layer_names:
+            else:
                 hb_faces.extend(import_objects(rhino3dm_file, layer,
-                    tolerance=model_tolerance))
+                    tolerance=model_tolerance, layer_objects=layer_objects))
     
     else:  # If config is not provided
         # Only use layers that are "on" in rhino
         for layer in rhino_visible_layers:
+            if layer.Index not in layer_objects:
+                continue
             hb_faces.extend(import_objects(rhino3dm_file, layer,
-                tolerance=model_tolerance))
+                tolerance=model_tolerance, layer_objects=layer_objects))
     
     # Honeybee model name
     name = name or '.'.join(os.path.basename(path).split('.')[:-1])
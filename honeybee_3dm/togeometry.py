@@ -62,10 +62,9 @@ def check_planarity(brep, tolerance):
     Returns:
         Bool. True if planar. Otherwise False.
     """
-    is_planar = [brep.Surfaces[i].IsPlanar(tolerance)
-                 for i in range(len(brep.Surfaces))]
-
-    return all(is_planar)
+    # Stop at the first non-planar surface
+    surfaces = brep.Surfaces
+    return all(surfaces[i].IsPlanar(tolerance) for i in range(len(surfaces)))
 
 
 def extract_mesh_faces_colors(mesh, color_by_face=False):
@@ -81,22 +80,22 @@ def extract_mesh_faces_colors(mesh, color_by_face=False):
 
     colors = None
     lb_faces = []
-    for i in range(len(mesh.Faces)):
-        face = mesh.Faces[i]
+    mesh_faces, vertex_colors = mesh.Faces, mesh.VertexColors
+    for i in range(len(mesh_faces)):
+        face = mesh_faces[i]
         if len(face) == 4:
             lb_faces.append((face[0], face[1], face[2], face[3]))
         else:
             lb_faces.append((face[0], face[1], face[2]))
-    if len(mesh.VertexColors) != 0:
+    if len(vertex_colors) != 0:
         colors = []
         if color_by_face is True:
-            for j in range(len(mesh.Faces)):
-                face = mesh.Faces[j]
-                col = mesh.VertexColors[face[0]]
+            for face in lb_faces:
+                col = vertex_colors[face[0]]
                 colors.append(lbc.Color(col.R, col.G, col.B))
         else:
-            for k in range(len(mesh.VertexColors)):
-                col = mesh.VertexColors[k]
+            for k in range(len(vertex_colors)):
+                col = vertex_colors[k]
                 colors.append(lbc.Color(col.R, col.G, col.B))
     return lb_faces, colors
 
@@ -111,7 +110,8 @@ def mesh_to_mesh3d(mesh, color_by_face=True):
     Returns:
         A Ladybug Mesh3D object.
     """
-    lb_verts = tuple(to_point3d(mesh.Vertices[i]) for i in range(len(mesh.Vertices)))
+    vertices = mesh.Vertices
+    lb_verts = tuple(to_point3d(vertices[i]) for i in range(len(vertices)))
     lb_faces, colors = extract_mesh_faces_colors(mesh, color_by_face)
     return Mesh3D(lb_verts, lb_faces, colors)
 
@@ -128,10 +128,13 @@ def mesh_to_face3d(mesh):
 
     faces = []
 
-    pts = [to_point3d(mesh.Vertices[i]) for i in range(len(mesh.Vertices))]
+    # Bind the rhino3dm collections once as every attribute access creates a new
+    # wrapper object
+    vertices, mesh_faces = mesh.Vertices, mesh.Faces
+    pts = [to_point3d(vertices[i]) for i in range(len(vertices))]
 
-    for j in range(len(mesh.Faces)):
-        face = mesh.Faces[j]
+    for j in range(len(mesh_faces)):
+        face = mesh_faces[j]
         if len(face) == 4:
             all_verts = (pts[face[0]], pts[face[1]],
                          pts[face[2]], pts[face[3]])
@@ -196,13 +199,14 @@ def brep_to_face3d(brep, tolerance, obj):
     Returns:
         A list of Ladybug Face3D objects.
     """
-    mesh = brep.Faces[0].GetMesh(rhino3dm.MeshType.Any)
-
     # If any of the edge is curved, mesh it
     for i in range(len(brep.Edges)):
         if not brep.Edges[i].IsLinear(tolerance):
             return [brep_to_meshed_face3d(brep, tolerance)]
 
+    # The render mesh is only needed for the vertex count of breps with linear edges
+    mesh = brep.Faces[0].GetMesh(rhino3dm.MeshType.Any)
+
     # If the brep has 3 or 4 vertices, mesh it
     if len(mesh.Vertices) == 4 or len(mesh.Vertices) == 3:
         return [brep_to_meshed_face3d(brep, tolerance)]
@@ -253,15 +257,13 @@ def brep_to_face3d(brep, tolerance, obj):
             hole_pts = [remove_dup_vertices(polyline.vertices, tolerance)
                         for polyline in sorted_polylines[1:]]
 
-            # Points on holes
-            total_hole_pts = [
-                pts for pts_lst in hole_pts for pts in pts_lst]
-
-            hole_pts_on_boundary = [
-                pts for pts in total_hole_pts if pts in boundary_pts]
+            # Points on holes that are also on the boundary
+            boundary_pts_set = set(boundary_pts)
+            hole_pts_on_boundary = any(
+                pt in boundary_pts_set for pts_lst in hole_pts for pt in pts_lst)
 
             # If any of the hole is touching the boundary of the face, mesh it
-            if len(hole_pts_on_boundary) > 0:
+            if hole_pts_on_boundary:
                 warnings.warn(
                     f'Object with id: {obj.Attributes.Id} has holes that touch the'
                     ' boundary of the object. This object will be meshed.'
@@ -307,19 +309,16 @@ def extrusion_to_face3d(extrusion, tolerance):
     Returns:
         A list of Ladybug Face3D objects.
     """
-    faces = []
-
     mesh = extrusion.GetMesh(rhino3dm.MeshType.Any)
     # Create face3ds
     faces = mesh_to_face3d(mesh)
     if len(faces) == 1:
         return faces
     else:
-        # Group faces by normal direction
-        face_normal = {face: face.normal.z for face in faces}
+        # Group faces by normal direction in a single pass
         face_groups = {}
-        for i, v in face_normal.items():
-            face_groups[v] = [i] if v not in face_groups.keys() else face_groups[v] + [i]
+        for face in faces:
+            face_groups.setdefault(face.normal.z, []).append(face)
         for normal in face_groups:
             polyface = Polyface3D.from_faces(face_groups[normal], tolerance)
             lines = list(polyface.naked_edges)
@@ -349,8 +348,9 @@ def to_face3d(obj, tolerance, *, raise_exception=False):
 
     # if it's a Brep
     if isinstance(rh_geo, rhino3dm.Brep):
-        # If it's a planar brep
-        if check_planarity(rh_geo, tolerance) and len(rh_geo.Faces) == 1:
+        # If it's a planar brep. Breps with multiple faces are checked face by face
+        # in multiface_brep_to_face3d so only single face breps are checked here
+        if len(rh_geo.Faces) == 1 and check_planarity(rh_geo, tolerance):
             lb_face = brep_to_face3d(rh_geo, tolerance, obj)
         # If it's a brep with multiple faces
         else:
@@ -0,0 +1,70 @@
+import json
+import pytest
+import rhino3dm
+from honeybee_3dm.config import check_config
+
+
+@pytest.fixture(scope='module')
+def rhino3dm_file():
+    return rhino3dm.File3dm.Read('./tests/assets/test.3dm')
+
+
+def write_config(folder, config):
+    """Write a config dictionary or text to a config.json file and get its path."""
+    config_path = folder / 'config.json'
+    config_path.write_text(config if isinstance(config, str) else json.dumps(config))
+    return str(config_path)
+
+
+def test_check_config(rhino3dm_file):
+    config_path = './tests/assets/config.json'
+
+    config = check_config(rhino3dm_file, config_path)
+    assert isinstance(config, dict)
+    assert config['sources']['radiance_material'] == './tests/assets/daylight.mat'
+    assert config['layers']['window']['honeybee_face_object'] == 'aperture'
+    assert config['layers']['window']['radiance_material'] == 'rad_glass_40'
+    assert config['layers']['grid']['grid_settings']['grid_size'] == 0.6
+
+
+def test_check_config_invalid_json(rhino3dm_file, tmp_path):
+    config_path = write_config(tmp_path, '{"layers": {')
+
+    with pytest.raises(ValueError):
+        check_config(rhino3dm_file, config_path)
+
+
+def test_check_config_invalid_layer(rhino3dm_file, tmp_path):
+    config_path = write_config(
+        tmp_path, {'layers': {'not-a-layer': {'honeybee_face_type': 'wall'}}})
+
+    with pytest.raises(KeyError):
+        check_config(rhino3dm_file, config_path)
+
+
+def test_check_config_invalid_sources(rhino3dm_file, tmp_path):
+    config_path = write_config(
+        tmp_path,
+        {'sources': {'materials': './tests/assets/daylight.mat'},
+         'layers': {'window': {'radiance_material': 'rad_glass_40'}}})
+
+    with pytest.raises(ValueError):
+        check_config(rhino3dm_file, config_path)
+
+
+def test_check_config_changed_mat_file(rhino3dm_file, tmp_path):
+    mat_path = tmp_path / 'daylight.mat'
+    mat_path.write_text(
+        'void glass rad_glass_40\n0\n0\n3 0.44 0.44 0.44\n')
+    config_path = write_config(
+        tmp_path,
+        {'sources': {'radiance_material': str(mat_path)},
+         'layers': {'window': {'radiance_material': 'rad_glass_40'}}})
+
+    config = check_config(rhino3dm_file, config_path)
+    assert config['layers']['window']['radiance_material'] == 'rad_glass_40'
+
+    # The radiance material file changes but the config file does not
+    mat_path.write_text('void glass rad_glass_50\n0\n0\n3 0.5 0.5 0.5\n')
+    with pytest.raises(ValueError):
+        check_config(rhino3dm_file, config_path)
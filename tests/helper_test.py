@@ -0,0 +1,15 @@
+from ladybug_geometry.geometry3d.pointvector import Point3D
+from ladybug_geometry.geometry3d.face import Face3D
+from honeybee.face import Face
+from honeybee_3dm.helper import face3d_to_hb_face_with_face_type
+
+
+def test_face3d_to_hb_face_cleans_name():
+    config = {'layers': {'wall': {'honeybee_face_type': 'wall'}}}
+    face3d = Face3D(
+        (Point3D(0, 0, 0), Point3D(1, 0, 0), Point3D(1, 0, 1), Point3D(0, 0, 1)))
+
+    hb_face = face3d_to_hb_face_with_face_type(config, face3d, 'My Wall', 'wall')
+    assert isinstance(hb_face, Face)
+    assert hb_face.identifier == 'My_Wall'
+    assert hb_face.display_name == 'My_Wall'
@@ -0,0 +1,26 @@
+import rhino3dm
+from honeybee_3dm.layer import objects_by_layer_index, objects_on_parent_child
+
+
+def test_objects_on_parent_child_file_order():
+    rhino3dm_file = rhino3dm.File3dm()
+    parent_index = rhino3dm_file.Layers.AddLayer('p', (0, 0, 0, 255))
+    child = rhino3dm.Layer()
+    child.Name = 'c'
+    child.ParentLayerId = rhino3dm_file.Layers[parent_index].Id
+    child_index = rhino3dm_file.Layers.Add(child)
+
+    # Objects are added on the child, the parent, and the child layer again
+    for count, layer_index in enumerate((child_index, parent_index, child_index)):
+        attributes = rhino3dm.ObjectAttributes()
+        attributes.LayerIndex = layer_index
+        attributes.Name = f'o{count}'
+        rhino3dm_file.Objects.Add(
+            rhino3dm.Point(rhino3dm.Point3d(count, 0, 0)), attributes)
+
+    layer_objects = objects_by_layer_index(rhino3dm_file)
+    scanned = objects_on_parent_child(rhino3dm_file, 'p')
+    grouped = objects_on_parent_child(rhino3dm_file, 'p', layer_objects=layer_objects)
+
+    assert [obj.Attributes.Name for obj in scanned] == ['o0', 'o1', 'o2']
+    assert [obj.Attributes.Name for obj in grouped] == ['o0', 'o1', 'o2']
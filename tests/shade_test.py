@@ -0,0 +1,30 @@
+import json
+from honeybee.shade import Shade
+from honeybee.door import Door
+from honeybee_3dm.model import import_3dm
+
+
+def test_shade_and_door_modifiers(tmp_path):
+    path = './tests/assets/test.3dm'
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(json.dumps({
+        'sources': {'radiance_material': './tests/assets/daylight.mat'},
+        'layers': {
+            'shade': {
+                'honeybee_face_object': 'shade',
+                'radiance_material': 'rad_context'
+            },
+            'door': {
+                'honeybee_face_object': 'door',
+                'radiance_material': 'rad_wall'
+            }
+        }
+    }))
+
+    model = import_3dm(path, config_path=str(config_path))
+    assert len(model.shades) == 1
+    assert isinstance(model.shades[0], Shade)
+    assert model.shades[0].properties.radiance.modifier.identifier == 'rad_context'
+    assert len(model.doors) == 1
+    assert isinstance(model.doors[0], Door)
+    assert model.doors[0].properties.radiance.modifier.identifier == 'rad_wall'